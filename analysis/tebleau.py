@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import re
 from collections import Counter
 import os
@@ -39,29 +40,38 @@ print(f"📊 전체 댓글 수: {len(df)}")
 print(f"📊 총 좋아요 수: {df['좋아요'].sum()}")
 >>>>>>> 3ea79ba97c3f5655835c9446184f9c1509352eb3
 
+# ===========================================
+# 0. 메모리 절약형 dtype 변환
+# ===========================================
+# pyarrow가 있으면 Arrow 기반 문자열, 없으면 pandas 기본 문자열 사용
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    HAS_PYARROW = False
+    TEXT_DTYPE = "string"
+
+df['댓글'] = df['댓글'].astype(TEXT_DTYPE)
+df['좋아요'] = pd.to_numeric(df['좋아요'], errors='coerce').fillna(0).astype('int32')
+
 # ===========================================
 # 1. 기본 통계 정보 추가
 # ===========================================
-df['댓글_길이'] = df['댓글'].str.len()
-df['단어_수'] = df['댓글'].str.split().str.len()
-df['댓글_ID'] = range(1, len(df) + 1)
+df['댓글_길이'] = df['댓글'].str.len().fillna(0).astype('int32')
+df['단어_수'] = df['댓글'].str.split().str.len().fillna(0).astype('int32')
+df['댓글_ID'] = np.arange(1, len(df) + 1, dtype='int32')
 
 # ===========================================
-# 2. 좋아요 구간 분류
+# 2. 좋아요 구간 분류 (범주형)
 # ===========================================
-def categorize_likes(likes):
-    if likes >= 100:
-        return '100+ 좋아요'
-    elif likes >= 50:
-        return '50-99 좋아요'
-    elif likes >= 10:
-        return '10-49 좋아요'
-    elif likes >= 1:
-        return '1-9 좋아요'
-    else:
-        return '0 좋아요'
-
-df['좋아요_구간'] = df['좋아요'].apply(categorize_likes)
+likes_order = ['100+ 좋아요', '50-99 좋아요', '10-49 좋아요', '1-9 좋아요', '0 좋아요']
+
+df['좋아요_구간'] = pd.cut(
+    df['좋아요'],
+    bins=[-np.inf, 0, 9, 49, 99, np.inf],
+    labels=likes_order[::-1]
+).cat.reorder_categories(likes_order, ordered=True)
 
 # ===========================================
 # 3. 키워드 추출 및 분석 (확장된 불용어)
@@ -92,9 +102,9 @@ for text in df['댓글']:
 top_keywords = [word for word, count in Counter(all_words).most_common(15)]
 print(f"\n🔑 상위 15개 키워드: {', '.join(top_keywords)}")
 
-# 각 댓글에 키워드 포함 여부 체크
+# 각 댓글에 키워드 포함 여부 체크 (0/1 값이므로 int8로 저장)
 for keyword in top_keywords:
-    df[f'키워드_{keyword}'] = df['댓글'].str.contains(keyword, case=False, na=False).astype(int)
+    df[f'키워드_{keyword}'] = df['댓글'].str.contains(keyword, case=False, regex=False, na=False).astype('int8')
 
 # ===========================================
 # 4. 감성 분석 (확장된 감성 단어)
@@ -117,20 +127,22 @@ negative_words = [
 
 df['긍정단어_수'] = df['댓글'].apply(
     lambda x: sum(1 for word in positive_words if word in str(x))
-)
+).astype('int8')
 df['부정단어_수'] = df['댓글'].apply(
     lambda x: sum(1 for word in negative_words if word in str(x))
-)
+).astype('int8')
 
-def classify_sentiment(row):
-    if row['긍정단어_수'] > row['부정단어_수']:
-        return '긍정'
-    elif row['부정단어_수'] > row['긍정단어_수']:
-        return '부정'
-    else:
-        return '중립'
+sentiment_order = ['긍정', '중립', '부정']
 
-df['감성'] = df.apply(classify_sentiment, axis=1)
+df['감성'] = pd.Categorical(
+    np.select(
+        [df['긍정단어_수'] > df['부정단어_수'], df['부정단어_수'] > df['긍정단어_수']],
+        ['긍정', '부정'],
+        default='중립'
+    ),
+    categories=sentiment_order,
+    ordered=True
+)
 
 print("✅ 감성 분석 완료!")
 
@@ -143,6 +155,22 @@ output_main = os.path.join(OUTPUT_DIR, "youtube_comments_tableau.csv")
 df.to_csv(output_main, index=False, encoding='utf-8-sig')
 print(f"\n✅ '{output_main}' 저장 완료!")
 
+# 압축 저장용 Parquet (pyarrow 필요)
+# 키워드 포함 여부 열들은 '키워드_비트' 정수 열 하나로 묶는다 (i번째 비트 = top_keywords[i])
+output_compact = None
+if HAS_PYARROW:
+    keyword_columns = [f'키워드_{keyword}' for keyword in top_keywords]
+    compact_df = df.drop(columns=keyword_columns)
+    keyword_bits = np.zeros(len(df), dtype='int32')
+    for i, column in enumerate(keyword_columns):
+        keyword_bits |= df[column].to_numpy(dtype='int32') << i
+    compact_df['키워드_비트'] = keyword_bits
+    compact_df.attrs['키워드_비트_순서'] = top_keywords
+
+    output_compact = os.path.join(OUTPUT_DIR, "youtube_comments_compact.parquet")
+    compact_df.to_parquet(output_compact, index=False, compression='zstd')
+    print(f"✅ '{output_compact}' 저장 완료!")
+
 # 키워드별 통계
 keyword_stats = []
 for keyword in top_keywords:
@@ -163,7 +191,7 @@ keyword_df_stats.to_csv(output_keywords, index=False, encoding='utf-8-sig')
 print(f"✅ '{output_keywords}' 저장 완료!")
 
 # 좋아요 구간별 통계 (순서 정렬 추가)
-likes_stats = df.groupby('좋아요_구간').agg({
+likes_stats = df.groupby('좋아요_구간', observed=True).agg({
     '댓글': 'count',
     '좋아요': ['sum', 'mean', 'max'],
     '댓글_길이': 'mean',
@@ -175,7 +203,6 @@ likes_stats.columns = ['좋아요_구간', '댓글_수', '총_좋아요', '평
 likes_stats = likes_stats.round(2)
 
 # 좋아요 구간 순서 정렬
-likes_order = ['100+ 좋아요', '50-99 좋아요', '10-49 좋아요', '1-9 좋아요', '0 좋아요']
 likes_stats['좋아요_구간'] = pd.Categorical(
     likes_stats['좋아요_구간'], 
     categories=likes_order, 
@@ -188,7 +215,7 @@ likes_stats.to_csv(output_likes, index=False, encoding='utf-8-sig')
 print(f"✅ '{output_likes}' 저장 완료!")
 
 # 감성 분석 통계
-sentiment_stats = df.groupby('감성').agg({
+sentiment_stats = df.groupby('감성', observed=True).agg({
     '댓글': 'count',
     '좋아요': ['sum', 'mean'],
     '댓글_길이': 'mean'
@@ -198,7 +225,6 @@ sentiment_stats.columns = ['감성', '댓글_수', '총_좋아요', '평균_좋
 sentiment_stats = sentiment_stats.round(2)
 
 # 감성 순서 정렬 (긍정 > 중립 > 부정)
-sentiment_order = ['긍정', '중립', '부정']
 sentiment_stats['감성'] = pd.Categorical(
     sentiment_stats['감성'],
     categories=sentiment_order,
@@ -288,5 +314,8 @@ print(f"4. {output_sentiment}")
 print(f"   → 감성 분석 통계")
 print(f"5. {output_viz}")
 print(f"   → 분석 요약 시각화")
+if output_compact:
+    print(f"6. {output_compact}")
+    print(f"   → 메인 데이터 압축본 (키워드 여부 비트 압축)")
 print("="*60)
 print("\n🎉 모든 작업이 완료되었습니다!")
\ No newline at end of file
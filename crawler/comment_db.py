@@ -0,0 +1,365 @@
+import os
+import sqlite3
+from datetime import datetime, timezone
+import pandas as pd
+
+DEFAULT_DB_PATH = "data/comments.db"
+
+# 트라이그램 토크나이저는 SQLite 3.34 이상 필요
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS comments (
+    id           INTEGER PRIMARY KEY,
+    platform     TEXT    NOT NULL,
+    comment_id   TEXT    NOT NULL,
+    target       TEXT    NOT NULL,
+    text         TEXT    NOT NULL,
+    likes        INTEGER NOT NULL DEFAULT 0,
+    published_at TEXT,
+    first_seen   TEXT    NOT NULL,
+    last_seen    TEXT    NOT NULL,
+    UNIQUE (platform, comment_id)
+);
+CREATE INDEX IF NOT EXISTS idx_comments_target ON comments(platform, target, published_at);
+CREATE INDEX IF NOT EXISTS idx_comments_likes ON comments(likes);
+CREATE INDEX IF NOT EXISTS idx_comments_published ON comments(published_at);
+
+CREATE TABLE IF NOT EXISTS like_history (
+    platform   TEXT    NOT NULL,
+    comment_id TEXT    NOT NULL,
+    seen_at    TEXT    NOT NULL,
+    likes      INTEGER NOT NULL,
+    PRIMARY KEY (platform, comment_id, seen_at)
+) WITHOUT ROWID;
+
+-- 감시 모드(watch.py)에서 댓글이 멈춰 감시를 끝낸 대상
+CREATE TABLE IF NOT EXISTS retired_targets (
+    platform   TEXT NOT NULL,
+    target     TEXT NOT NULL,
+    retired_at TEXT NOT NULL,
+    PRIMARY KEY (platform, target)
+) WITHOUT ROWID;
+
+-- 날짜별 API 할당량 사용량 (재시작해도 그날 사용량 유지)
+CREATE TABLE IF NOT EXISTS api_quota (
+    api  TEXT    NOT NULL,
+    day  TEXT    NOT NULL,
+    used INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (api, day)
+) WITHOUT ROWID;
+
+-- 부분 문자열 검색용 (한글 조사가 붙어도 매칭)
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+    text, content='comments', content_rowid='id', tokenize='trigram'
+);
+-- 어절 접두어 검색용
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_words USING fts5(
+    text, content='comments', content_rowid='id', tokenize='unicode61', prefix='1 2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS comments_ai AFTER INSERT ON comments BEGIN
+    INSERT INTO comments_fts(rowid, text) VALUES (new.id, new.text);
+    INSERT INTO comments_words(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS comments_ad AFTER DELETE ON comments BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO comments_words(comments_words, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS comments_au AFTER UPDATE OF text ON comments
+WHEN old.text IS NOT new.text BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO comments_words(comments_words, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO comments_fts(rowid, text) VALUES (new.id, new.text);
+    INSERT INTO comments_words(rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+RESULT_COLUMNS = ['플랫폼', '댓글_ID', '대상', '댓글', '좋아요', '작성시간']
+
+
+TIMESTAMP_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S%z',      # 네이버 regTime, 유튜브 publishedAt
+    '%Y-%m-%dT%H:%M:%S.%f%z',   # 소수점 초가 붙은 경우
+)
+
+
+def to_utc(timestamp):
+    """
+    플랫폼별 작성 시각 문자열을 UTC ISO 8601로 통일
+
+    정렬/기간 검색이 어긋나지 않도록, 해석할 수 없는 값은 원본 대신 None으로 저장한다.
+
+    Args:
+        timestamp: '2026-01-07T09:38:54+0900', '2026-01-07T00:38:54Z' 등
+    Returns:
+        utc: 'YYYY-MM-DDTHH:MM:SSZ' 형식 문자열 (해석 불가 시 None)
+    """
+    if not timestamp:
+        return None
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            parsed = datetime.strptime(timestamp, fmt)
+        except ValueError:
+            continue
+        return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    print(f"⚠️  작성 시각 형식을 알 수 없어 비워둡니다: {timestamp!r}")
+    return None
+
+
+def _fts_phrase(term):
+    """FTS5 쿼리 문법 문자를 무력화하도록 큰따옴표로 감싼다"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term):
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+class CommentDB:
+    def __init__(self, path=DEFAULT_DB_PATH):
+        """
+        네이버/유튜브 댓글을 누적 저장하는 로컬 SQLite 데이터베이스
+
+        Args:
+            path: DB 파일 경로 (기본값: data/comments.db)
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def upsert(self, platform, target, comments):
+        """
+        (platform, comment_id) 기준으로 댓글 추가/갱신
+
+        좋아요수가 처음 수집되었거나 바뀐 경우에만 like_history에 기록한다.
+
+        Args:
+            platform: 'naver' 또는 'youtube'
+            target: 기사/영상 식별자
+            comments: 댓글 묶음 (CommentBatch)
+        Returns:
+            new_count: 새로 추가된 댓글 수
+        """
+        # 같은 초에 두 번 저장돼도 좋아요 이력이 겹치지 않도록 마이크로초까지 기록
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        rows = [
+            (platform, str(c.comment_id), target, c.text, c.likes, to_utc(c.published_at), now)
+            for c in comments if c.comment_id is not None
+        ]
+
+        with self.conn:
+            history_changes = self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO like_history(platform, comment_id, seen_at, likes)
+                SELECT ?1, ?2, ?4, ?3
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM comments
+                    WHERE platform = ?1 AND comment_id = ?2 AND likes = ?3
+                )
+                """,
+                [(r[0], r[1], r[4], now) for r in rows]
+            ).rowcount
+
+            # 새 댓글은 INSERT OR IGNORE로 추가하고 추가된 행 수로 센다
+            # (rowcount는 FTS 트리거의 변경을 포함하지 않음)
+            new_count = self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO comments(platform, comment_id, target, text, likes,
+                                               published_at, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?7, ?7)
+                """,
+                rows
+            ).rowcount
+
+            # 이미 있던 댓글은 본문/좋아요수/마지막 수집시각 갱신
+            self.conn.executemany(
+                """
+                UPDATE comments SET
+                    text = ?3,
+                    likes = ?4,
+                    published_at = COALESCE(?5, published_at),
+                    last_seen = ?6
+                WHERE platform = ?1 AND comment_id = ?2
+                """,
+                [(r[0], r[1], r[3], r[4], r[5], now) for r in rows]
+            )
+
+        print(f"🗄️  DB 저장: 새 댓글 {new_count}개, 좋아요 변경 {history_changes - new_count}개")
+        return new_count
+
+    def search(self, query, mode='keyword', platform=None, target=None,
+               min_likes=None, since=None, until=None, order='likes', limit=100,
+               substring_scan=False):
+        """
+        댓글 전문 검색
+
+        Args:
+            query: 검색어
+            mode: 'keyword' (공백으로 나눈 모든 단어 포함),
+                  'phrase' (검색어 전체가 그대로 포함),
+                  'prefix' (해당 단어로 시작하는 어절 포함)
+            platform: 'naver' / 'youtube' 로 제한
+            target: 기사/영상 식별자로 제한
+            min_likes: 최소 좋아요수
+            since, until: 작성 시각 범위 (UTC ISO 8601)
+            order: 'likes' (좋아요 순) 또는 'time' (최신 순)
+            limit: 최대 결과 수
+            substring_scan: True면 3글자 미만 검색어를 어절 중간까지 LIKE로 찾음
+                            (인덱스를 쓰지 못해 전체 테이블을 훑으므로 느림)
+        Returns:
+            df: 검색 결과 DataFrame
+        """
+        terms = [query.strip()] if mode == 'phrase' else query.split()
+        terms = [t for t in terms if t]
+        if not terms:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        where = []
+        params = []
+
+        if mode == 'prefix':
+            where.append('id IN (SELECT rowid FROM comments_words WHERE comments_words MATCH ?)')
+            params.append(' AND '.join(_fts_phrase(t) + '*' for t in terms))
+        elif mode in ('keyword', 'phrase'):
+            # 트라이그램 인덱스는 3글자 이상만 사용 가능.
+            # 짧은 검색어(정부, 국민 등)는 어절 접두어 인덱스로 찾는다 ('정부가', '정부는' 포함)
+            long_terms = [t for t in terms if len(t) >= 3]
+            short_terms = [t for t in terms if len(t) < 3]
+            if long_terms:
+                where.append('id IN (SELECT rowid FROM comments_fts WHERE comments_fts MATCH ?)')
+                params.append(' AND '.join(_fts_phrase(t) for t in long_terms))
+            if short_terms and substring_scan:
+                for t in short_terms:
+                    where.append("text LIKE ? ESCAPE '\\'")
+                    params.append(_like_pattern(t))
+            elif short_terms:
+                where.append('id IN (SELECT rowid FROM comments_words WHERE comments_words MATCH ?)')
+                params.append(' AND '.join(_fts_phrase(t) + '*' for t in short_terms))
+        else:
+            raise ValueError(f"지원하지 않는 검색 방식입니다: {mode}")
+
+        if platform:
+            where.append('platform = ?')
+            params.append(platform)
+        if target:
+            where.append('target = ?')
+            params.append(target)
+        if min_likes is not None:
+            where.append('likes >= ?')
+            params.append(min_likes)
+        if since:
+            where.append('published_at >= ?')
+            params.append(since)
+        if until:
+            where.append('published_at < ?')
+            params.append(until)
+
+        order_by = 'published_at DESC' if order == 'time' else 'likes DESC'
+        sql = (
+            'SELECT platform, comment_id, target, text, likes, published_at FROM comments '
+            f'WHERE {" AND ".join(where)} ORDER BY {order_by} LIMIT ?'
+        )
+        params.append(limit)
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+    def like_history(self, platform, comment_id):
+        """
+        댓글 1건의 좋아요수 변화 이력
+
+        Returns:
+            df: 수집시각, 좋아요 DataFrame
+        """
+        rows = self.conn.execute(
+            'SELECT seen_at, likes FROM like_history '
+            'WHERE platform = ? AND comment_id = ? ORDER BY seen_at',
+            (platform, str(comment_id))
+        ).fetchall()
+        return pd.DataFrame(rows, columns=['수집시각', '좋아요'])
+
+    def recent_comment_ids(self, platform, target, limit=500):
+        """
+        기사/영상 1건의 최근 댓글 ID (증분 수집의 정지 기준)
+
+        Returns:
+            ids: 댓글 ID(str) 리스트 (최신 순)
+        """
+        rows = self.conn.execute(
+            'SELECT comment_id FROM comments WHERE platform = ? AND target = ? '
+            'ORDER BY published_at DESC LIMIT ?',
+            (platform, target, limit)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def retire_target(self, platform, target):
+        """감시 종료된 대상 기록 (다시 감시하려면 retired_targets에서 행 삭제)"""
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO retired_targets(platform, target, retired_at) VALUES (?, ?, ?)',
+                (platform, target, now)
+            )
+
+    def retired_targets(self):
+        """
+        감시 종료된 대상 전체
+
+        Returns:
+            keys: (platform, target) 집합
+        """
+        return set(self.conn.execute('SELECT platform, target FROM retired_targets').fetchall())
+
+    def quota_used(self, api, day):
+        """그날 사용한 API 할당량 (unit)"""
+        row = self.conn.execute(
+            'SELECT used FROM api_quota WHERE api = ? AND day = ?', (api, day)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def add_quota_used(self, api, day, units):
+        """그날 API 할당량 사용량에 units 추가"""
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO api_quota(api, day, used) VALUES (?, ?, ?) '
+                'ON CONFLICT(api, day) DO UPDATE SET used = used + excluded.used',
+                (api, day, units)
+            )
+
+    def target_comments(self, platform, target):
+        """
+        기사/영상 1건의 전체 댓글 (최신 순)
+
+        Returns:
+            df: 검색 결과와 같은 열 구성의 DataFrame
+        """
+        rows = self.conn.execute(
+            'SELECT platform, comment_id, target, text, likes, published_at FROM comments '
+            'WHERE platform = ? AND target = ? ORDER BY published_at DESC',
+            (platform, target)
+        ).fetchall()
+        return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+
+# 실행 (누적 DB 검색)
+if __name__ == "__main__":
+    query = input('🔍 검색어를 입력해주세요: ')
+    mode = input('검색 방식 (keyword / phrase / prefix, 기본 keyword): ').strip() or 'keyword'
+
+    with CommentDB() as db:
+        result = db.search(query, mode=mode, limit=50)
+
+    print(f"\n총 {len(result)}개 댓글 (좋아요 순 상위 50개)")
+    print(result.to_string(index=False))
@@ -0,0 +1,85 @@
+from array import array
+import numpy as np
+import pandas as pd
+
+
+class Comment:
+    """
+    댓글 1건 (슬롯 기반으로 dict보다 메모리를 적게 사용)
+    """
+    __slots__ = ('text', 'likes', 'comment_id', 'published_at')
+
+    def __init__(self, text, likes, comment_id=None, published_at=None):
+        self.text = text
+        self.likes = likes
+        self.comment_id = comment_id
+        self.published_at = published_at
+
+    def __repr__(self):
+        return f"Comment(text={self.text[:20]!r}, likes={self.likes})"
+
+
+class CommentBatch:
+    """
+    크롤러 수집 결과를 담는 배열 기반 댓글 묶음
+
+    댓글마다 한글 키를 가진 dict를 만드는 대신, 본문은 리스트에,
+    좋아요(공감)수는 int64 배열에 열 단위로 저장한다.
+    """
+    __slots__ = ('_texts', '_likes', '_ids', '_published')
+
+    def __init__(self):
+        self._texts = []
+        self._likes = array('q')
+        self._ids = []
+        self._published = []
+
+    def append(self, text, likes, comment_id=None, published_at=None):
+        """
+        댓글 1건 추가
+
+        Args:
+            text: 댓글 본문
+            likes: 좋아요(공감)수
+            comment_id: 플랫폼 댓글 ID (DB 저장 시 중복 제거 키)
+            published_at: 작성 시각 (ISO 8601 문자열)
+        """
+        self._texts.append(text)
+        self._likes.append(int(likes or 0))
+        self._ids.append(comment_id)
+        self._published.append(published_at)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __iter__(self):
+        for text, likes, comment_id, published_at in zip(
+                self._texts, self._likes, self._ids, self._published):
+            yield Comment(text, likes, comment_id, published_at)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            batch = CommentBatch()
+            batch._texts = self._texts[index]
+            batch._likes = self._likes[index]
+            batch._ids = self._ids[index]
+            batch._published = self._published[index]
+            return batch
+        return Comment(self._texts[index], self._likes[index],
+                       self._ids[index], self._published[index])
+
+    def to_frame(self, text_column='댓글', likes_column='좋아요'):
+        """
+        기존 CSV와 같은 열 구성의 DataFrame으로 변환
+
+        Args:
+            text_column: 댓글 본문 열 이름
+            likes_column: 좋아요(공감)수 열 이름
+        Returns:
+            df: 댓글 DataFrame
+        """
+        return pd.DataFrame({
+            text_column: self._texts,
+            # 버퍼 프로토콜로 한 번에 복사 (이후 append 시 버퍼 잠금 방지)
+            likes_column: np.array(self._likes, dtype=np.int64),
+        })
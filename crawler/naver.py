@@ -5,22 +5,52 @@ import time
 import os
 import re
 import json
+from comments import CommentBatch
+from comment_db import CommentDB
+
+
+class NaverCommentError(Exception):
+    """댓글 API가 정상 응답(JSON, success=true)을 주지 않은 경우"""
+
+
+def extract_article_id(article_url):
+    """네이버 뉴스 URL에서 (oid, aid) 추출, 실패 시 None"""
+    match = re.search(r'/article/(\d+)/(\d+)', article_url)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
 
 def get_naver_comments(article_url, max_comments=1000):
     """네이버 뉴스 댓글 수집 (댓글, 공감수만)"""
+    comments = fetch_naver_comments(article_url, max_comments)
+    if comments is None:
+        return None
+    return comments.to_frame(likes_column='공감수')
+
+
+def fetch_naver_comments(article_url, max_comments=1000, sort='FAVORITE', known_ids=None,
+                         before_request=None, raise_errors=False):
+    """
+    네이버 뉴스 댓글 수집 (댓글 ID, 작성시각 포함 CommentBatch 반환)
+
+    known_ids를 주면 이미 수집한 댓글은 건너뛰고, 그런 댓글이 나온 페이지에서
+    수집을 멈춘다. sort='NEW'와 함께 쓰면 직전 수집 이후의 새 댓글만 가져온다.
+    before_request는 페이지 요청마다 먼저 호출된다 (요청 속도 제한용).
+    raise_errors=True면 요청 실패 시 수집분을 버리고 예외를 그대로 올린다.
+    """
     
     # URL에서 oid, aid 추출
-    match = re.search(r'/article/(\d+)/(\d+)', article_url)
-    if not match:
+    article_id = extract_article_id(article_url)
+    if article_id is None:
         print("❌ 올바른 네이버 뉴스 URL이 아닙니다.")
         return None
     
-    oid = match.group(1)
-    aid = match.group(2)
+    oid, aid = article_id
     
     print(f"📰 기사 정보: oid={oid}, aid={aid}")
     
-    comments = []
+    comments = CommentBatch()
     seen_contents = set()  # 중복 체크용
     page = 1
     no_new_comments = 0  # 새 댓글 없는 횟수
@@ -49,14 +79,18 @@ def get_naver_comments(article_url, max_comments=1000):
             'page': str(page),
             'currentPage': str(page),
             'refresh': 'false',
-            'sort': 'FAVORITE'
+            'sort': sort
         }
         
         try:
+            if before_request:
+                before_request()
             response = requests.get(api_url, params=params, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 print(f"⚠️  페이지 {page} 요청 실패: {response.status_code}")
+                if raise_errors:
+                    raise requests.HTTPError(f"status {response.status_code}", response=response)
                 break
             
             # JSONP → JSON 변환
@@ -66,10 +100,20 @@ def get_naver_comments(article_url, max_comments=1000):
             
             if json_start == -1 or json_end == 0:
                 print("⚠️  JSON 파싱 실패")
+                if raise_errors:
+                    raise NaverCommentError(f"JSON이 아닌 응답: {text[:100]!r}")
                 break
             
             data = json.loads(text[json_start:json_end])
-            comment_list = data.get('result', {}).get('commentList', [])
+            
+            # 차단/오류 응답 (success=false 또는 result 없음)
+            if not data.get('success', True) or 'result' not in data:
+                print(f"⚠️  댓글 API 오류: {data.get('code')} {data.get('message')}")
+                if raise_errors:
+                    raise NaverCommentError(f"API 오류: {data.get('code')} {data.get('message')}")
+                break
+            
+            comment_list = data['result'].get('commentList') or []
             
             if not comment_list:
                 print(f"✅ 페이지 {page}에 더 이상 댓글 없음")
@@ -77,23 +121,32 @@ def get_naver_comments(article_url, max_comments=1000):
             
             # 새로운 댓글 수 카운트
             new_count = 0
+            reached_known = False
             
             # 댓글과 공감수만 저장 (중복 제거)
             for comment in comment_list:
                 content = comment.get('contents', '')
                 likes = comment.get('sympathyCount', 0)
+                comment_id = comment.get('commentNo')
+                published_at = comment.get('regTime')
+                
+                # 이전 수집분에 도달 (증분 수집)
+                if known_ids is not None and str(comment_id) in known_ids:
+                    reached_known = True
+                    continue
                 
                 # 중복 체크 (댓글 내용 기준)
                 if content not in seen_contents:
                     seen_contents.add(content)
-                    comments.append({
-                        '댓글': content,
-                        '공감수': likes
-                    })
+                    comments.append(content, likes, comment_id, published_at)
                     new_count += 1
             
             print(f"📄 페이지 {page}: 새로운 댓글 {new_count}개 (총 {len(comments)}개)")
             
+            if reached_known:
+                print("✅ 이전 수집 댓글까지 도달")
+                break
+            
             # 새로운 댓글이 없으면 카운트 증가
             if new_count == 0:
                 no_new_comments += 1
@@ -108,18 +161,21 @@ def get_naver_comments(article_url, max_comments=1000):
             
         except Exception as e:
             print(f"❌ 에러 발생: {e}")
+            if raise_errors:
+                raise
             break
     
-    return pd.DataFrame(comments)
+    return comments
 
 
 # 실행
 if __name__ == "__main__":
     article_url = input('📰링크를 입력해주세요:')
     
-    df = get_naver_comments(article_url, max_comments=500)
+    comments = fetch_naver_comments(article_url, max_comments=500)
     
-    if df is not None and len(df) > 0:
+    if comments is not None and len(comments) > 0:
+        df = comments.to_frame(likes_column='공감수')
         print("\n=== 수집 결과 ===")
         print(df.head(10))
         print(f"\n총 댓글: {len(df)}개")
@@ -133,5 +189,10 @@ if __name__ == "__main__":
         
         df.to_csv(filename, index=False, encoding="utf-8-sig")
         print(f"\n✅ 저장 완료: {filename}")
+        
+        # 누적 DB에도 저장 (댓글 ID 기준 중복 제거)
+        oid, aid = extract_article_id(article_url)
+        with CommentDB() as db:
+            db.upsert('naver', f'{oid}/{aid}', comments)
     else:
         print("\n❌ 댓글 수집 실패")
\ No newline at end of file
@@ -4,7 +4,7 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.keys import Keys
 import time
-import pandas as pd
+from comments import CommentBatch
 
 url = "https://www.youtube.com/watch?v=xPwSffZnllQ"
 
@@ -29,7 +29,7 @@ for _ in range(50):
 # 🔥 핵심 2: 댓글 DOM 생성 대기
 time.sleep(3)
 
-comments = []
+comments = CommentBatch()
 
 comment_boxes = driver.find_elements(
     By.CSS_SELECTOR, "ytd-comment-thread-renderer"
@@ -54,14 +54,11 @@ for box in comment_boxes:
     except:
         like = 0
 
-    comments.append({
-        "댓글": content,
-        "좋아요수": like
-    })
+    comments.append(content, like)
 
 driver.quit()
 
-df = pd.DataFrame(comments)
+df = comments.to_frame(likes_column="좋아요수")
 print(df.head())
 print("총 댓글 수:", len(df))
 
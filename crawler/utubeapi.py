@@ -4,6 +4,8 @@ from googleapiclient.errors import HttpError
 import pandas as pd
 from datetime import datetime
 from dotenv import load_dotenv
+from comments import CommentBatch
+from comment_db import CommentDB
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -18,6 +20,8 @@ class YouTubeCommentCrawler:
             api_key: YouTube Data API 키
         """
         self.youtube = build('youtube', 'v3', developerKey=api_key)
+        # 사용한 API 할당량 (commentThreads.list 1회 = 1 unit)
+        self.quota_used = 0
 
     def extract_video_id(self, url):
         """
@@ -35,50 +39,68 @@ class YouTubeCommentCrawler:
         else:
             return url
 
-    def get_comments(self, video_id, max_results=5000):
+    def get_comments(self, video_id, max_results=5000, order="relevance", known_ids=None,
+                     before_request=None, raise_errors=False):
         """
         특정 비디오의 댓글 가져오기 (대댓글 제외)
 
         Args:
             video_id: YouTube 비디오 ID
             max_results: 가져올 최대 댓글 수
+            order: 'time' 또는 'relevance'
+            known_ids: 이미 수집한 댓글 ID 집합. order='time'과 함께 쓰면
+                       처음 만나는 수집된 댓글에서 멈춰 새 댓글만 가져온다.
+            before_request: 페이지 요청마다 먼저 호출할 함수 (요청 속도 제한용)
+            raise_errors: True면 API 오류 시 수집분을 버리고 HttpError를 그대로 올림
         Returns:
-            comments: 댓글 리스트
+            comments: 댓글 묶음 (CommentBatch)
         """
-        comments = []
+        comments = CommentBatch()
 
         try:
             request = self.youtube.commentThreads().list(
                 part="snippet",
                 videoId=video_id,
                 maxResults=min(100, max_results),
-                order="relevance"  # 'time' 또는 'relevance'
+                order=order
             )
 
             while request and len(comments) < max_results:
+                if before_request:
+                    before_request()
+                # 실패한 요청도 할당량을 쓰므로 요청 전에 센다
+                self.quota_used += 1
                 response = request.execute()
+                reached_known = False
 
                 for item in response['items']:
+                    # 이전 수집분에 도달 (증분 수집)
+                    if known_ids is not None and item['snippet']['topLevelComment']['id'] in known_ids:
+                        reached_known = True
+                        break
+
                     # 최상위 댓글만 수집
                     comment = item['snippet']['topLevelComment']['snippet']
                     # 줄바꿈 문자를 공백으로 변경
                     clean_text = comment['textOriginal'].replace('\n', ' ')
-                    comments.append({
-                        '댓글': clean_text,
-                        '좋아요': comment['likeCount']
-                    })
+                    comments.append(
+                        clean_text,
+                        comment['likeCount'],
+                        item['snippet']['topLevelComment']['id'],
+                        comment['publishedAt']
+                    )
 
                     if len(comments) >= max_results:
                         break
 
                 # 다음 페이지
-                if 'nextPageToken' in response and len(comments) < max_results:
+                if 'nextPageToken' in response and len(comments) < max_results and not reached_known:
                     request = self.youtube.commentThreads().list(
                         part="snippet",
                         videoId=video_id,
                         maxResults=min(100, max_results - len(comments)),
                         pageToken=response['nextPageToken'],
-                        order="relevance"
+                        order=order
                     )
                 else:
                     break
@@ -87,15 +109,17 @@ class YouTubeCommentCrawler:
             print(f"오류 발생: {e}")
             if e.resp.status == 403:
                 print("댓글이 비활성화되어 있거나 API 할당량을 초과했습니다.")
+            if raise_errors:
+                raise
 
-        return comments[:max_results]
+        return comments
 
     def save_to_csv(self, comments, filename=None, save_dir="data"):
         """
         댓글을 CSV 파일로 저장
 
         Args:
-            comments: 댓글 리스트
+            comments: 댓글 묶음 (CommentBatch)
             filename: 저장할 파일명
             save_dir: 저장할 폴더 경로 (기본값: data)
         """
@@ -108,7 +132,7 @@ class YouTubeCommentCrawler:
         # 전체 경로 생성
         filepath = os.path.join(save_dir, filename)
         
-        df = pd.DataFrame(comments)
+        df = comments.to_frame()
         df.to_csv(filepath, index=False, encoding='utf-8-sig')
         print(f"'{filepath}' 파일로 저장되었습니다. (총 {len(comments)}개 댓글)")
 
@@ -136,8 +160,13 @@ if __name__ == "__main__":
 
     # 결과 출력
     print(f"\n총 {len(comments)}개의 댓글을 가져왔습니다.\n")
-    for i, comment in enumerate(comments[:5], 1):
-        print(f"{i}. {comment['댓글'][:50]}... (좋아요: {comment['좋아요']})\n")
+    for i in range(min(5, len(comments))):
+        comment = comments[i]
+        print(f"{i + 1}. {comment.text[:50]}... (좋아요: {comment.likes})\n")
 
     # CSV로 저장
-    crawler.save_to_csv(comments, save_dir="data/utube")
\ No newline at end of file
+    crawler.save_to_csv(comments, save_dir="data/utube")
+
+    # 누적 DB에도 저장 (댓글 ID 기준 중복 제거)
+    with CommentDB() as db:
+        db.upsert('youtube', video_id, comments)
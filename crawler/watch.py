@@ -0,0 +1,400 @@
+import os
+import time
+import heapq
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from dotenv import load_dotenv
+from comment_db import CommentDB
+from naver import extract_article_id, fetch_naver_comments
+
+load_dotenv()
+
+MIN_INTERVAL = 60            # 가장 뜨거운 대상의 재수집 간격 (초)
+MAX_INTERVAL = 6 * 60 * 60   # 가장 식은 대상의 재수집 간격 (초)
+TARGET_NEW_PER_POLL = 50     # 한 번 수집할 때 기대하는 새 댓글 수
+RETIRE_IDLE_POLLS = 4        # 최대 간격에서 연속으로 새 댓글이 없으면 감시 종료
+RETIRE_FAILED_POLLS = 8      # 연속으로 이만큼 수집에 실패하면 감시 종료
+VELOCITY_SMOOTHING = 0.5     # 댓글 속도 지수이동평균 가중치
+DELTA_MAX_COMMENTS = 1000    # 1회 증분 수집 최대 댓글 수
+KNOWN_IDS_WINDOW = 500       # 증분 수집 정지 기준으로 기억할 대상별 최근 댓글 ID 수
+POLL_MAX_PAGES = -(-DELTA_MAX_COMMENTS // 100)   # 1회 수집 최대 페이지 요청 수 (페이지당 100개)
+
+# YouTube API 할당량은 태평양 시간 자정에 초기화
+YOUTUBE_QUOTA_TZ = ZoneInfo('America/Los_Angeles')
+
+
+def is_permanent_error(error):
+    """
+    대상이 삭제되었거나 댓글이 막혀 다시 시도해도 소용없는 오류인지 판단
+
+    Args:
+        error: requests.HTTPError (네이버) 또는 googleapiclient HttpError (유튜브)
+    """
+    # 네이버: 기사 삭제 등
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) in (404, 410):
+        return True
+
+    # 유튜브: 영상 삭제(404), 댓글 사용 중지/비공개(403)
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    content = getattr(error, 'content', b'') or b''
+    if status == 404:
+        return True
+    if status == 403 and (b'commentsDisabled' in content or b'forbidden' in content):
+        return True
+    return False
+
+
+class WatchTarget:
+    """
+    감시 대상 1건 (네이버 기사 또는 유튜브 영상)
+    """
+    __slots__ = ('platform', 'target_id', 'url', 'interval', 'next_poll',
+                 'last_poll', 'velocity', 'idle_polls', 'failures', 'known_ids')
+
+    def __init__(self, platform, target_id, url, recent_ids):
+        self.platform = platform
+        self.target_id = target_id
+        self.url = url
+        self.interval = MIN_INTERVAL
+        self.next_poll = 0.0
+        self.last_poll = None
+        self.velocity = 0.0      # 시간당 새 댓글 수
+        self.idle_polls = 0
+        self.failures = 0        # 연속 수집 실패 횟수
+        # 최근 댓글 ID (삽입 순서 = 오래된 것부터, KNOWN_IDS_WINDOW개까지만 유지)
+        self.known_ids = {}
+        self.remember(recent_ids)
+
+    def remember(self, comment_ids):
+        """
+        새로 수집한 댓글 ID를 기억하고 오래된 ID는 버림
+
+        Args:
+            comment_ids: 댓글 ID(str) 목록 (최신 순)
+        """
+        for comment_id in reversed(comment_ids):
+            self.known_ids.pop(comment_id, None)
+            self.known_ids[comment_id] = None
+        while len(self.known_ids) > KNOWN_IDS_WINDOW:
+            del self.known_ids[next(iter(self.known_ids))]
+
+    def reschedule(self, new_count, now):
+        """
+        이번 수집 결과로 댓글 속도를 갱신하고 다음 수집 간격 결정
+
+        Returns:
+            retired: 감시를 끝내야 하면 True
+        """
+        self.failures = 0
+
+        if self.last_poll is None:
+            # 첫 수집은 이전 수집분 전체가 섞여 속도를 잴 수 없으므로,
+            # 두 번째 수집까지는 최소 간격으로 다시 확인한다
+            self.last_poll = now
+            self.interval = MIN_INTERVAL
+            self.next_poll = now + self.interval
+            return False
+
+        hours = max(now - self.last_poll, 1) / 3600
+        self.velocity = (VELOCITY_SMOOTHING * (new_count / hours)
+                         + (1 - VELOCITY_SMOOTHING) * self.velocity)
+        self.last_poll = now
+
+        if new_count == 0:
+            # 최대 간격에 도달한 뒤의 빈 수집만 종료 조건으로 센다
+            if self.interval >= MAX_INTERVAL:
+                self.idle_polls += 1
+                if self.idle_polls >= RETIRE_IDLE_POLLS:
+                    return True
+            self.interval = min(self.interval * 2, MAX_INTERVAL)
+        else:
+            self.idle_polls = 0
+            # 다음 수집 때 TARGET_NEW_PER_POLL개 정도가 쌓이도록 간격 조정
+            ideal = TARGET_NEW_PER_POLL / max(self.velocity, 1e-6) * 3600
+            self.interval = min(max(ideal, MIN_INTERVAL), MAX_INTERVAL)
+
+        self.next_poll = now + self.interval
+        return False
+
+    def backoff(self, now):
+        """
+        수집 실패 시 재시도 시각 결정 (댓글 속도, 수집 간격, 종료 조건에는 반영하지 않음)
+        """
+        self.failures += 1
+        self.next_poll = now + min(MIN_INTERVAL * 2 ** self.failures, MAX_INTERVAL)
+
+
+class RateLimiter:
+    """
+    전체 대상이 공유하는 토큰 버킷 요청 제한
+    """
+    def __init__(self, requests_per_minute, burst=5):
+        self.rate = requests_per_minute / 60
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """토큰 1개를 쓸 수 있을 때까지 대기"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) / self.rate)
+
+
+class CommentWatcher:
+    def __init__(self, db, youtube_crawler=None, requests_per_minute=30,
+                 youtube_daily_quota=10000):
+        """
+        여러 기사/영상을 하나의 프로세스에서 계속 재수집하는 감시기
+
+        댓글이 빠르게 달리는 대상은 자주, 식은 대상은 드물게 수집하고,
+        오래 조용한 대상은 감시 목록에서 뺀다. 매번 최신순으로 이전 수집분까지만
+        가져와 DB에 저장한다.
+
+        Args:
+            db: CommentDB
+            youtube_crawler: YouTubeCommentCrawler (없으면 유튜브 대상 무시)
+            requests_per_minute: 전체 대상 합산 분당 페이지 요청 수
+            youtube_daily_quota: 하루 동안 쓸 YouTube API 할당량 (unit).
+                                 남은 양을 초기화 시각까지 고르게 나눠 쓰며, 사용량은 DB에 기록된다
+        """
+        self.db = db
+        self.youtube = youtube_crawler
+        self.limiter = RateLimiter(requests_per_minute)
+        self.youtube_daily_quota = youtube_daily_quota
+        # 남은 할당량을 초기화 시각까지 고르게 나눠 쓰도록 다음 YouTube 수집 가능 시각을 둔다
+        self.youtube_next_allowed = 0.0
+
+        self.targets = {}     # (platform, target_id) -> WatchTarget
+        self.retired = db.retired_targets()   # 종료된 대상은 목록 파일에 남아 있어도 다시 추가하지 않음
+        self.schedule = []    # (next_poll, 순번, WatchTarget) 최소 힙
+        self.ready = []       # (-velocity, 순번, WatchTarget) 수집 대기 힙
+        self._seq = 0
+
+    def add(self, url):
+        """
+        URL로 감시 대상 추가 (이미 있거나 감시 종료된 대상이면 무시)
+
+        Returns:
+            added: 새로 추가했으면 True
+        """
+        url = url.strip()
+        if not url:
+            return False
+
+        if 'naver.com' in url:
+            article_id = extract_article_id(url)
+            if article_id is None:
+                print(f"⚠️  올바른 네이버 뉴스 URL이 아닙니다: {url}")
+                return False
+            key = ('naver', f'{article_id[0]}/{article_id[1]}')
+        else:
+            if self.youtube is None:
+                print(f"⚠️  YouTube API 키가 없어 건너뜁니다: {url}")
+                return False
+            key = ('youtube', self.youtube.extract_video_id(url))
+
+        if key in self.targets or key in self.retired:
+            return False
+
+        target = WatchTarget(key[0], key[1], url, self.db.recent_comment_ids(*key))
+        self.targets[key] = target
+        self._push(self.schedule, target.next_poll, target)
+        return True
+
+    def load(self, path):
+        """
+        대상 목록 파일(한 줄에 URL 1개)에서 새 대상만 추가
+
+        Returns:
+            added: 추가된 대상 수
+        """
+        with open(path, encoding='utf-8') as f:
+            return sum(self.add(line) for line in f if not line.startswith('#'))
+
+    def _push(self, heap, priority, target):
+        self._seq += 1
+        heapq.heappush(heap, (priority, self._seq, target))
+
+    def _quota_day(self):
+        return datetime.now(YOUTUBE_QUOTA_TZ).date().isoformat()
+
+    def _youtube_quota_left(self):
+        return self.youtube_daily_quota - self.db.quota_used('youtube', self._quota_day())
+
+    def _pace_youtube(self, units):
+        """
+        YouTube 수집 1회에 쓴 할당량을 DB에 기록하고 다음 YouTube 수집 가능 시각 결정
+
+        남은 할당량 / 초기화까지 남은 시간으로 초당 사용 가능량을 구해,
+        이번에 쓴 units만큼 다음 수집을 늦춘다.
+        """
+        if units:
+            self.db.add_quota_used('youtube', self._quota_day(), units)
+        until_reset = self._seconds_until_quota_reset()
+        units_per_second = max(self._youtube_quota_left(), 0) / max(until_reset, 1)
+        if units_per_second > 0:
+            wait = units / units_per_second
+        else:
+            wait = until_reset
+        self.youtube_next_allowed = time.time() + min(wait, until_reset)
+
+    def _seconds_until_quota_reset(self):
+        now = datetime.now(YOUTUBE_QUOTA_TZ)
+        tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(),
+                                    tzinfo=YOUTUBE_QUOTA_TZ)
+        return (tomorrow - now).total_seconds()
+
+    def poll(self, target):
+        """
+        대상 1건 증분 수집 후 DB 저장
+
+        Returns:
+            new_count: 새 댓글 수
+        """
+        if target.platform == 'naver':
+            comments = fetch_naver_comments(target.url, max_comments=DELTA_MAX_COMMENTS,
+                                            sort='NEW', known_ids=target.known_ids,
+                                            before_request=self.limiter.acquire, raise_errors=True)
+        else:
+            comments = self.youtube.get_comments(target.target_id, max_results=DELTA_MAX_COMMENTS,
+                                                 order='time', known_ids=target.known_ids,
+                                                 before_request=self.limiter.acquire, raise_errors=True)
+
+        if not comments:
+            return 0
+
+        new_count = self.db.upsert(target.platform, target.target_id, comments)
+        target.remember([str(c.comment_id) for c in comments if c.comment_id is not None])
+        return new_count
+
+    def step(self):
+        """
+        수집 시각이 된 대상 중 댓글 속도가 가장 빠른 것 1건 수집
+
+        Returns:
+            polled: 수집했으면 True, 대기 중인 대상이 없으면 False
+        """
+        now = time.time()
+        while self.schedule and self.schedule[0][0] <= now:
+            _, _, target = heapq.heappop(self.schedule)
+            self._push(self.ready, -target.velocity, target)
+
+        if not self.ready:
+            return False
+
+        _, _, target = heapq.heappop(self.ready)
+
+        if target.platform == 'youtube':
+            # 증분 수집이라도 최대 POLL_MAX_PAGES 페이지를 요청할 수 있으므로 그만큼 남아 있어야 수집
+            if self._youtube_quota_left() < POLL_MAX_PAGES:
+                target.next_poll = now + self._seconds_until_quota_reset()
+                self._push(self.schedule, target.next_poll, target)
+                return True
+            # 할당량 배분 속도보다 빠르면 미룸 (같은 시각에 모이면 속도 빠른 대상부터 수집)
+            if now < self.youtube_next_allowed:
+                target.next_poll = self.youtube_next_allowed
+                self._push(self.schedule, target.next_poll, target)
+                return True
+            units_before = self.youtube.quota_used
+
+        print(f"\n🔄 [{target.platform}] {target.target_id} 수집 "
+              f"(속도 {target.velocity:.1f}개/시간, 간격 {target.interval / 60:.1f}분)")
+        try:
+            new_count = self.poll(target)
+        except Exception as e:
+            # 일시적인 실패는 빈 수집으로 치지 않고 점점 늦춰 재시도
+            print(f"❌ 에러 발생: {e}")
+            if is_permanent_error(e):
+                self._retire(target, "대상이 삭제되었거나 댓글을 볼 수 없어 감시 종료")
+                return True
+            if target.platform == 'youtube' and b'quotaExceeded' in getattr(e, 'content', b''):
+                # 실제 할당량이 바닥났으므로 그날 남은 양을 모두 쓴 것으로 기록
+                self.db.add_quota_used('youtube', self._quota_day(), max(self._youtube_quota_left(), 0))
+                target.next_poll = now + self._seconds_until_quota_reset()
+            else:
+                target.backoff(time.time())
+                if target.failures >= RETIRE_FAILED_POLLS:
+                    self._retire(target, f"{target.failures}번 연속 수집 실패로 감시 종료")
+                    return True
+            self._push(self.schedule, target.next_poll, target)
+            return True
+        finally:
+            if target.platform == 'youtube':
+                self._pace_youtube(self.youtube.quota_used - units_before)
+
+        if target.reschedule(new_count, time.time()):
+            self._retire(target, "댓글이 멈춰 감시 종료")
+        else:
+            self._push(self.schedule, target.next_poll, target)
+        return True
+
+    def _retire(self, target, reason):
+        print(f"💤 [{target.platform}] {target.target_id} {reason}")
+        key = (target.platform, target.target_id)
+        del self.targets[key]
+        self.retired.add(key)
+        self.db.retire_target(*key)
+
+    def run(self, targets_path=None, reload_interval=60):
+        """
+        감시 대상이 모두 종료될 때까지 반복 수집
+
+        Args:
+            targets_path: 대상 목록 파일 (수정되면 새 URL을 자동 추가)
+            reload_interval: 대상 목록 파일 확인 주기 (초)
+        """
+        last_mtime = None
+        last_check = 0.0
+
+        while True:
+            if targets_path and time.time() - last_check >= reload_interval:
+                last_check = time.time()
+                try:
+                    mtime = os.path.getmtime(targets_path)
+                    if mtime != last_mtime:
+                        added = self.load(targets_path)
+                        last_mtime = mtime
+                        if added:
+                            print(f"📋 감시 대상 {added}개 추가 (총 {len(self.targets)}개)")
+                except OSError as e:
+                    # 편집기 저장 중에는 파일이 잠시 없을 수 있으므로 현재 대상을 유지
+                    print(f"⚠️  대상 목록 파일을 읽지 못해 기존 대상을 유지합니다: {e}")
+
+            if self.step():
+                continue
+
+            if not self.targets and not targets_path:
+                print("✅ 모든 대상 감시 종료")
+                break
+
+            # 다음 수집 시각까지 대기 (대상 목록 확인 주기를 넘지 않게)
+            wait = self.schedule[0][0] - time.time() if self.schedule else reload_interval
+            time.sleep(min(max(wait, 0.1), reload_interval))
+
+
+# 실행
+if __name__ == "__main__":
+    targets_path = input('📋 감시 대상 목록 파일 (한 줄에 URL 1개, 기본값 targets.txt): ').strip() or 'targets.txt'
+
+    if not os.path.exists(targets_path):
+        print(f"❌ 파일을 찾을 수 없습니다: {targets_path}")
+        exit(1)
+
+    youtube_crawler = None
+    API_KEY = os.getenv('YOUTUBE_API_KEY')
+    if API_KEY:
+        from utubeapi import YouTubeCommentCrawler
+        youtube_crawler = YouTubeCommentCrawler(API_KEY)
+    else:
+        print("⚠️  YOUTUBE_API_KEY가 없어 네이버 기사만 감시합니다.")
+
+    with CommentDB() as db:
+        watcher = CommentWatcher(db, youtube_crawler)
+        watcher.run(targets_path)